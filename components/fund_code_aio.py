@@ -96,8 +96,8 @@ class FundCodeAIO(html.Div):
             return options
 
         except RequestException as e:
-            logger.error("获取基金代码失败: %s", str(e), exc_info=True)
+            logger.error("获取基金代码失败: %s", e, exc_info=True)
             return []
         except (KeyError, ValueError) as e:
-            logger.error("解析基金代码数据失败: %s", str(e), exc_info=True)
+            logger.error("解析基金代码数据失败: %s", e, exc_info=True)
             return []
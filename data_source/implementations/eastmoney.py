@@ -6,6 +6,8 @@ from typing import Any, Dict, List
 import execjs
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from data_source.interface import IDataSource
 from task.task_config import FundType
@@ -20,6 +22,21 @@ logger = logging.getLogger(__name__)
 
 # 请求超时时间（秒）
 REQUEST_TIMEOUT = 10
+# 连接池大小
+HTTP_POOL_SIZE = 20
+
+
+def _create_session() -> requests.Session:
+    """创建共享的 HTTP 会话，复用连接并对失败的请求自动重试"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class EastMoneyDataSource(IDataSource):
@@ -45,6 +62,9 @@ class EastMoneyDataSource(IDataSource):
     def get_version(cls) -> str:
         return "1.0.0"
 
+    # 所有实例共享一个会话，避免每次请求重新建立 TCP/TLS 连接
+    _session = _create_session()
+
     def __init__(self):
         self.headers = {
             "Referer": "https://fund.eastmoney.com/",
@@ -64,7 +84,7 @@ class EastMoneyDataSource(IDataSource):
             }
             logger.debug("请求基金搜索建议: %s, params: %s", url, params)
 
-            response = requests.get(
+            response = self._session.get(
                 url, params=params, headers=self.headers, timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
@@ -89,10 +109,10 @@ class EastMoneyDataSource(IDataSource):
             logger.debug("获取到 %d 个搜索建议", len(results))
             return results
         except (KeyError, ValueError) as e:
-            logger.error("解析基金搜索建议数据失败: %s", str(e), exc_info=True)
+            logger.error("解析基金搜索建议数据失败: %s", e, exc_info=True)
             return []
         except requests.exceptions.RequestException as e:
-            logger.error("请求基金搜索建议失败: %s", str(e), exc_info=True)
+            logger.error("请求基金搜索建议失败: %s", e, exc_info=True)
             return []
 
     def get_fund_info(self, fund_code: str) -> Dict[str, Any]:
@@ -104,7 +124,7 @@ class EastMoneyDataSource(IDataSource):
             }
             logger.debug("请求基金信息: %s, params: %s", url, params)
 
-            response = requests.get(
+            response = self._session.get(
                 url, params=params, headers=self.headers, timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
@@ -126,10 +146,10 @@ class EastMoneyDataSource(IDataSource):
                 "valuation_growth": data.get("gszzl", 0),  # 估值增长率
             }
         except (KeyError, ValueError) as e:
-            logger.error("解析基金信息数据失败: %s", str(e), exc_info=True)
+            logger.error("解析基金信息数据失败: %s", e, exc_info=True)
             raise ValueError(f"解析基金信息数据失败: {str(e)}") from e
         except requests.exceptions.RequestException as e:
-            logger.error("请求基金信息失败: %s", str(e), exc_info=True)
+            logger.error("请求基金信息失败: %s", e, exc_info=True)
             raise ValueError(f"请求基金信息失败: {str(e)}") from e
 
     def get_fund_detail(self, fund_code: str) -> Dict[str, Any]:
@@ -148,7 +168,7 @@ class EastMoneyDataSource(IDataSource):
         try:
             url = f"https://fundf10.eastmoney.com/jbgk_{fund_code}.html"
 
-            response = requests.get(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
+            response = self._session.get(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
             # 使用 BeautifulSoup 解析 HTML
@@ -170,6 +190,10 @@ class EastMoneyDataSource(IDataSource):
                     fund_data[key] = value
                     logger.debug("解析到基金详情: %s = %s", key, value)
 
+            # "成立日期/规模" 格式为 "成立日期 / 规模"，只切分一次
+            establishment = fund_data.get("成立日期/规模", "")
+            establishment_date, _, establishment_size = establishment.partition("/")
+
             # 将原始数据映射到标准化的字段名
             return {
                 "code": fund_code,
@@ -177,13 +201,8 @@ class EastMoneyDataSource(IDataSource):
                 "full_name": fund_data.get("基金全称"),
                 "type": fund_data.get("基金类型"),
                 "issue_date": format_date(fund_data.get("发行日期"), input_format="%Y年%m月%d日"),
-                "establishment_date": format_date(
-                    fund_data.get("成立日期/规模", "").split("/")[0],
-                    input_format="%Y年%m月%d日",
-                ),
-                "establishment_size": extract_number_with_unit(
-                    fund_data.get("成立日期/规模", "").split("/")[1], False
-                ),
+                "establishment_date": format_date(establishment_date, input_format="%Y年%m月%d日"),
+                "establishment_size": extract_number_with_unit(establishment_size, False),
                 "company": fund_data.get("基金管理人"),
                 "custodian": fund_data.get("基金托管人"),
                 "fund_manager": fund_data.get("基金经理人"),
@@ -205,10 +224,10 @@ class EastMoneyDataSource(IDataSource):
             }
 
         except (KeyError, ValueError) as e:
-            logger.error("解析基金详情数据失败: %s", str(e), exc_info=True)
+            logger.error("解析基金详情数据失败: %s", e, exc_info=True)
             raise ValueError(f"解析基金详情数据失败: {str(e)}") from e
         except requests.exceptions.RequestException as e:
-            logger.error("请求基金详情失败: %s", str(e), exc_info=True)
+            logger.error("请求基金详情失败: %s", e, exc_info=True)
             raise ValueError(f"请求基金详情失败: {str(e)}") from e
 
     def get_fund_nav_history_size(self) -> int:
@@ -238,7 +257,9 @@ class EastMoneyDataSource(IDataSource):
             }
             logger.debug("请求基金历史净值: %s, params: %s", url, params)
 
-            response = requests.get(url, params=params, headers=self.headers)
+            response = self._session.get(
+                url, params=params, headers=self.headers, timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
             # 解析返回的HTML内容
             text = response.text
@@ -306,7 +327,7 @@ class EastMoneyDataSource(IDataSource):
             return results
 
         except Exception as e:
-            logger.error("获取基金历史净值失败: %s", str(e), exc_info=True)
+            logger.error("获取基金历史净值失败: %s", e, exc_info=True)
             raise ValueError(f"获取基金历史净值失败: {str(e)}") from e
 
     def get_fund_type(self, type: int) -> int:
@@ -370,7 +391,9 @@ class EastMoneyDataSource(IDataSource):
             }
             logger.debug("请求基金最新净值列表: %s, params: %s", url, params)
 
-            response = requests.get(url, params=params, headers=self.headers)
+            response = self._session.get(
+                url, params=params, headers=self.headers, timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
 
             # 解析返回的JavaScript对象
@@ -397,7 +420,7 @@ class EastMoneyDataSource(IDataSource):
             json_str = ctx.eval("JSON.stringify(db)")
 
             data = json.loads(json_str)
-            print("解析到的数据: %s", data)
+            logger.debug("解析到 %d 条净值数据", len(data.get("datas", [])))
             results = {
                 "page": data["curpage"],
                 "page_size": page_size,
@@ -428,5 +451,5 @@ class EastMoneyDataSource(IDataSource):
             return results
 
         except Exception as e:
-            logger.error("获取基金最新净值列表失败: %s", str(e), exc_info=True)
+            logger.error("获取基金最新净值列表失败: %s", e, exc_info=True)
             raise ValueError(f"获取基金最新净值列表失败: {str(e)}") from e
@@ -1,4 +1,5 @@
 import logging
+import threading
 from datetime import datetime
 from typing import Any, Callable, Dict, Optional, TypeVar, Union
 
@@ -18,11 +19,14 @@ class DataSourceProxy:
         if not data_source_name:
             data_source_name = DATA_SOURCE_DEFAULT
 
+        # 单次查询历史净值的最大天数，是数据源的固定值，成功获取后缓存
+        self._nav_history_size_response: Optional[Dict[str, Any]] = None
+
         try:
             self._data_source = DataSourceFactory.create(data_source_name)
             logger.info("数据源 %s 初始化成功", data_source_name)
         except ValueError as e:
-            logger.error("初始化数据源失败: %s", str(e))
+            logger.error("初始化数据源失败: %s", e)
             raise ValueError(f"初始化数据源失败: {str(e)}") from e
 
     def _call_api(
@@ -58,7 +62,7 @@ class DataSourceProxy:
             result = api_func(*args, **kwargs)
             return format_response(data=result, message="success", is_array=is_array)
         except ValueError as e:
-            logger.error("%s: %s", error_msg, str(e))
+            logger.error("%s: %s", error_msg, e)
             if return_empty:
                 return format_response(message=str(e), code=200, is_array=is_array)
             return format_response(message=str(e), code=500, is_array=is_array)
@@ -114,12 +118,21 @@ class DataSourceProxy:
     def get_fund_nav_history_size(
         self,
     ) -> Dict[str, Any]:
-        """获取基金历史净值"""
-        return self._call_api(
+        """获取基金历史净值单次查询的最大天数
+
+        成功的结果会被缓存，之后的调用不再请求数据源
+        """
+        if self._nav_history_size_response is not None:
+            return self._nav_history_size_response
+
+        response = self._call_api(
             func_name="get_fund_nav_history_size",
             api_func=self._data_source.get_fund_nav_history_size,
             error_msg="获取基金历史净值失败",
         )
+        if response["code"] == 200:
+            self._nav_history_size_response = response
+        return response
 
     def get_fund_nav_list(
         self,
@@ -136,3 +149,32 @@ class DataSourceProxy:
             page=page,
             type=type,
         )
+
+
+# 按数据源名称缓存的共享代理实例
+_proxies: Dict[str, DataSourceProxy] = {}
+_proxies_lock = threading.Lock()
+
+
+def get_data_source_proxy(data_source_name: Optional[str] = None) -> DataSourceProxy:
+    """获取共享的数据源代理实例
+
+    同一数据源在进程内只创建一次代理，供各任务复用，避免每次执行任务都重新初始化数据源
+
+    Args:
+        data_source_name: 数据源名称，为空时使用默认数据源
+
+    Returns:
+        数据源代理实例
+    """
+    if not data_source_name:
+        data_source_name = DATA_SOURCE_DEFAULT
+
+    proxy = _proxies.get(data_source_name)
+    if proxy is None:
+        with _proxies_lock:
+            proxy = _proxies.get(data_source_name)
+            if proxy is None:
+                proxy = DataSourceProxy(data_source_name)
+                _proxies[data_source_name] = proxy
+    return proxy
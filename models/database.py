@@ -1,7 +1,8 @@
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
 
+from peewee import EXCLUDED, Field, chunked, fn
 
 from kz_dash.models.base import db_connection
 from kz_dash.models.database import get_record_count
@@ -17,6 +18,11 @@ from .fund_user import ModelFundPosition, ModelFundTransaction
 
 logger = logging.getLogger(__name__)
 
+# 批量写入时单条语句包含的最大记录数
+BULK_WRITE_BATCH_SIZE = 100
+# SQLite 单条语句允许的最大绑定参数数量(旧版本默认 999)
+SQLITE_MAX_VARIABLES = 999
+
 
 # 基金持仓相关操作
 def get_fund_positions(portfolio_id: str) -> List[Dict[str, Any]]:
@@ -191,12 +197,12 @@ def get_transactions() -> List[Dict[str, Any]]:
                     }
                     result.append(transaction_dict)
                 except Exception as e:
-                    logger.error("Error processing transaction %s: %s", trans.id, str(e))
+                    logger.error("Error processing transaction %s: %s", trans.id, e)
 
             return result
 
         except Exception as e:
-            logger.error("获取交易记录失败: %s", str(e))
+            logger.error("获取交易记录失败: %s", e)
             return []
 
 
@@ -275,7 +281,7 @@ def add_transaction(
 
             return True
     except Exception as e:
-        logger.error("添加交易记录失败: %s", str(e))
+        logger.error("添加交易记录失败: %s", e)
         return False
 
 
@@ -294,27 +300,38 @@ def update_transaction(
     """更新交易记录"""
     try:
         with db_connection():
-            # 获取原交易记录
-            old_transaction = ModelFundTransaction.get_by_id(transaction_id)
-
-            # 更新交易记录
-            old_transaction.portfolio = portfolio_id
-            old_transaction.code = fund_code
-            old_transaction.name = fund_name
-            old_transaction.type = transaction_type
-            old_transaction.amount = amount
-            old_transaction.shares = shares or 0.0
-            old_transaction.nav = nav or 0.0
-            old_transaction.fee = fee
-            old_transaction.transaction_date = trade_time
-            old_transaction.save()
+            # 只查询原记录的组合和基金代码，修改后两者的持仓都需要重新计算
+            original = (
+                ModelFundTransaction.select(
+                    ModelFundTransaction.portfolio, ModelFundTransaction.fund_code
+                )
+                .where(ModelFundTransaction.id == transaction_id)
+                .tuples()
+                .first()
+            )
+            if original is None:
+                logger.error("更新交易记录失败: 交易记录 %s 不存在", transaction_id)
+                return False
+
+            ModelFundTransaction.update(
+                portfolio=portfolio_id,
+                fund_code=fund_code,
+                type=transaction_type,
+                amount=amount,
+                shares=shares or 0.0,
+                nav=nav or 0.0,
+                fee=fee,
+                transaction_date=trade_time,
+            ).where(ModelFundTransaction.id == transaction_id).execute()
 
             # 重新计算持仓
             recalculate_position(portfolio_id, fund_code)
+            if original != (portfolio_id, fund_code):
+                recalculate_position(*original)
 
             return True
     except Exception as e:
-        logger.error("更新交易记录失败: %s", str(e))
+        logger.error("更新交易记录失败: %s", e)
         return False
 
 
@@ -376,7 +393,7 @@ def update_position_after_transaction(
                     purchase_date=datetime.now(),
                 )
     except Exception as e:
-        logger.error("更新持仓失败: %s", str(e))
+        logger.error("更新持仓失败: %s", e)
 
 
 def recalculate_position(portfolio_id: str, fund_code: str) -> None:
@@ -435,4 +452,119 @@ def recalculate_position(portfolio_id: str, fund_code: str) -> None:
                     purchase_date=datetime.now(),
                 )
     except Exception as e:
-        logger.error("重新计算持仓失败: %s", str(e))
+        logger.error("重新计算持仓失败: %s", e)
+
+
+# 基金相关批量查询
+def get_fund_establishment_dates(fund_codes: List[str]) -> Dict[str, Optional[date]]:
+    """获取已存在基金的成立日期
+
+    Args:
+        fund_codes: 基金代码列表
+
+    Returns:
+        Dict[str, Optional[date]]: 基金代码到成立日期的映射，数据库中不存在的基金不在结果中
+    """
+    if not fund_codes:
+        return {}
+
+    # 分批查询，避免 IN 子句超过 SQLite 绑定参数上限
+    results: Dict[str, Optional[date]] = {}
+    with db_connection(db_name=ModelFund._meta.db_name):
+        for codes in chunked(fund_codes, SQLITE_MAX_VARIABLES):
+            query = ModelFund.select(ModelFund.code, ModelFund.establishment_date).where(
+                ModelFund.code.in_(codes)
+            )
+            results.update(query.tuples())
+    return results
+
+
+def get_fund_nav_counts(fund_codes: List[str]) -> Dict[str, int]:
+    """获取基金的历史净值数量
+
+    Args:
+        fund_codes: 基金代码列表
+
+    Returns:
+        Dict[str, int]: 基金代码到净值数量的映射，没有净值的基金不在结果中
+    """
+    if not fund_codes:
+        return {}
+
+    # 分批查询，避免 IN 子句超过 SQLite 绑定参数上限
+    results: Dict[str, int] = {}
+    with db_connection(db_name=ModelFundNav._meta.db_name):
+        for codes in chunked(fund_codes, SQLITE_MAX_VARIABLES):
+            query = (
+                ModelFundNav.select(ModelFundNav.fund, fn.COUNT(ModelFundNav.nav_date))
+                .where(ModelFundNav.fund.in_(codes))
+                .group_by(ModelFundNav.fund)
+            )
+            results.update(query.tuples())
+    return results
+
+
+# 通用批量写入
+def update_records_bulk(
+    model,
+    rows: List[Dict[str, Any]],
+    conflict_target: List[Field],
+    batch_size: Optional[int] = None,
+) -> int:
+    """批量插入或更新记录
+
+    在一个事务内分批执行 INSERT ... ON CONFLICT DO UPDATE，
+    记录已存在时更新除冲突字段以外的所有字段
+
+    Args:
+        model: 数据模型类
+        rows: 记录列表，键为字段名或列名，各记录的键可以不同，
+            已存在的记录只更新该记录中给出的字段
+        conflict_target: 判断记录是否已存在的字段(主键或唯一索引)
+        batch_size: 单条语句包含的记录数，默认按每组实际写入的列数计算，
+            保证绑定参数不超过 SQLITE_MAX_VARIABLES 且不超过 BULK_WRITE_BATCH_SIZE
+
+    Returns:
+        int: 写入的记录数
+    """
+    if not rows:
+        return 0
+
+    # 按记录包含的字段分组，每组只写入并更新本组自带的列，
+    # 避免缺失字段以默认值覆盖数据库中的原值
+    # 注意: peewee 字段的 == 会生成查询表达式，这里统一按字段名判断
+    combined = model._meta.combined
+    updated_at = model._meta.fields.get("updated_at")
+    conflict_names = {field.name for field in conflict_target}
+    now = datetime.now()
+
+    groups: Dict[Tuple[str, ...], List[Dict[Field, Any]]] = {}
+    for row in rows:
+        item = {combined[key]: value for key, value in row.items()}
+        if updated_at is not None:
+            item[updated_at] = now
+        key = tuple(sorted(field.name for field in item))
+        groups.setdefault(key, []).append(item)
+
+    with db_connection(db_name=model._meta.db_name):
+        with model._meta.database.atomic():
+            for data in groups.values():
+                fields = list(data[0])
+                update = {
+                    field: getattr(EXCLUDED, field.column_name)
+                    for field in fields
+                    if field.name not in conflict_names
+                }
+                # insert_many 还会为带默认值的字段(如 created_at)绑定参数
+                names = {field.name for field in fields}
+                columns = len(names | {field.name for field in model._meta.defaults})
+                group_batch_size = batch_size or max(
+                    1, min(BULK_WRITE_BATCH_SIZE, SQLITE_MAX_VARIABLES // columns)
+                )
+                for batch in chunked(data, group_batch_size):
+                    model.insert_many(batch).on_conflict(
+                        conflict_target=conflict_target, update=update
+                    ).execute()
+
+    logger.debug("批量写入 %s: %d 条记录", model._meta.table_name, len(rows))
+    return len(rows)
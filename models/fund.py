@@ -75,9 +75,9 @@ class ModelFund(BaseModel):
                 "name": self.name,
                 "full_name": self.full_name,
                 "type": self.type,
-                "issue_date": self.issue_date.strftime("%Y-%m-%d") if self.issue_date else None,
+                "issue_date": self.issue_date.isoformat() if self.issue_date else None,
                 "establishment_date": (
-                    self.establishment_date.strftime("%Y-%m-%d")
+                    self.establishment_date.isoformat()
                     if self.establishment_date
                     else None
                 ),
@@ -142,7 +142,7 @@ class ModelFundNav(BaseModel):
         result.update(
             {
                 "fund_code": self.fund_code,
-                "nav_date": self.nav_date.strftime("%Y-%m-%d") if self.nav_date else None,
+                "nav_date": self.nav_date.isoformat() if self.nav_date else None,
                 "nav": float(self.nav) if self.nav else None,
                 "acc_nav": float(self.acc_nav) if self.acc_nav else None,
                 "daily_return": float(self.daily_return) if self.daily_return else None,
@@ -69,7 +69,7 @@ def update_statistics(data: Dict[str, Any]) -> Tuple[str, str, str, str, str]:
             format_money(data.get("daily_return", 0)),
         )
     except Exception as e:
-        logger.error("更新统计数据失败: %s", str(e))
+        logger.error("更新统计数据失败: %s", e)
         raise PreventUpdate
 
 
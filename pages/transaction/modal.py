@@ -406,7 +406,7 @@ def handle_transaction_save(
         logger.error("保存交易记录失败")
 
     except Exception as e:
-        logger.error("处理交易保存失败: %s", str(e), exc_info=True)
+        logger.error("处理交易保存失败: %s", e, exc_info=True)
 
     return dash.no_update, dash.no_update
 
@@ -465,7 +465,7 @@ def calculate_fee(
         return current_fee
 
     except Exception as e:
-        logger.error("计算费用失败: %s", str(e))
+        logger.error("计算费用失败: %s", e)
 
     return dash.no_update
 
@@ -504,5 +504,5 @@ def update_nav_value(fund_code: Optional[str], trade_time: Optional[str]) -> Opt
         return dash.no_update
 
     except Exception as e:
-        logger.error("获取基金净值失败: %s", str(e))
+        logger.error("获取基金净值失败: %s", e)
         return dash.no_update
@@ -1,5 +1,4 @@
 import logging
-import time
 from datetime import datetime
 from typing import Any, Dict
 
@@ -61,10 +60,9 @@ class DataSyncTask(BaseTask):
         start_date = kwargs.get("start_date")
         end_date = kwargs.get("end_date")
 
-        # 模拟同步过程
+        # 同步过程(尚未接入实际同步逻辑，仅上报进度)
         total_steps = 4
         for i in range(total_steps):
-            time.sleep(1)
             progress = (i + 1) * 25
             self.update_progress(progress)
 
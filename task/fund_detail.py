@@ -2,7 +2,7 @@ import logging
 from datetime import datetime
 from typing import Any, Dict
 
-from data_source.proxy import DataSourceProxy
+from data_source.proxy import get_data_source_proxy
 from kz_dash.models.database import update_record
 from models.fund import ModelFund
 
@@ -11,6 +11,33 @@ from kz_dash.scheduler.base_task import BaseTask
 
 logger = logging.getLogger(__name__)
 
+# 基金详情字段及缺失时的默认值
+FUND_DETAIL_FIELDS = (
+    ("code", None),
+    ("name", "未知名称"),
+    ("full_name", "未知全称"),
+    ("type", "未知类型"),
+    ("issue_date", None),
+    ("establishment_date", None),
+    ("establishment_size", 0),
+    ("company", "未知公司"),
+    ("custodian", "未知托管人"),
+    ("fund_manager", "未知基金经理"),
+    ("management_fee", 0),
+    ("custodian_fee", 0),
+    ("sales_service_fee", 0),
+    ("tracking", ""),
+    ("performance_benchmark", ""),
+    ("investment_scope", ""),
+    ("investment_target", ""),
+    ("investment_philosophy", ""),
+    ("investment_strategy", ""),
+    ("dividend_policy", ""),
+    ("risk_return_characteristics", ""),
+    ("data_source", None),
+    ("data_source_version", None),
+)
+
 
 class FundDetailTask(BaseTask):
     """基金详情更新任务"""
@@ -41,8 +68,8 @@ class FundDetailTask(BaseTask):
             raise ValueError("fund_code is required")
 
         try:
-            # 初始化数据源
-            data_source = DataSourceProxy()
+            # 获取数据源
+            data_source = get_data_source_proxy()
             # 更新进度
             self.update_progress(20)
             logger.info("正在获取基金 %s 的详情...", fund_code)
@@ -54,31 +81,7 @@ class FundDetailTask(BaseTask):
             fund_info = fund_info_response["data"]
 
             # 检查必要字段是否存在，设置默认值
-            fund_data = {
-                "code": fund_info.get("code"),
-                "name": fund_info.get("name", "未知名称"),
-                "full_name": fund_info.get("full_name", "未知全称"),
-                "type": fund_info.get("type", "未知类型"),
-                "issue_date": fund_info.get("issue_date"),
-                "establishment_date": fund_info.get("establishment_date"),
-                "establishment_size": fund_info.get("establishment_size", 0),
-                "company": fund_info.get("company", "未知公司"),
-                "custodian": fund_info.get("custodian", "未知托管人"),
-                "fund_manager": fund_info.get("fund_manager", "未知基金经理"),
-                "management_fee": fund_info.get("management_fee", 0),
-                "custodian_fee": fund_info.get("custodian_fee", 0),
-                "sales_service_fee": fund_info.get("sales_service_fee", 0),
-                "tracking": fund_info.get("tracking", ""),
-                "performance_benchmark": fund_info.get("performance_benchmark", ""),
-                "investment_scope": fund_info.get("investment_scope", ""),
-                "investment_target": fund_info.get("investment_target", ""),
-                "investment_philosophy": fund_info.get("investment_philosophy", ""),
-                "investment_strategy": fund_info.get("investment_strategy", ""),
-                "dividend_policy": fund_info.get("dividend_policy", ""),
-                "risk_return_characteristics": fund_info.get("risk_return_characteristics", ""),
-                "data_source": fund_info.get("data_source"),
-                "data_source_version": fund_info.get("data_source_version"),
-            }
+            fund_data = {key: fund_info.get(key, default) for key, default in FUND_DETAIL_FIELDS}
 
             self.update_progress(80)
             logger.info("正在更新数据库...")
@@ -91,5 +94,5 @@ class FundDetailTask(BaseTask):
             return fund_data
 
         except Exception as e:
-            logger.error("更新基金信息失败: %s", str(e), exc_info=True)  # 添加完整的错误堆栈
+            logger.error("更新基金信息失败: %s", e, exc_info=True)  # 添加完整的错误堆栈
             raise
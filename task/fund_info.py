@@ -2,7 +2,7 @@ import logging
 from datetime import datetime
 from typing import Any, Dict
 
-from data_source.proxy import DataSourceProxy
+from data_source.proxy import get_data_source_proxy
 
 from task.task_config import PARAM_FUND_CODE
 from kz_dash.scheduler.base_task import BaseTask
@@ -39,8 +39,8 @@ class FundInfoTask(BaseTask):
             raise ValueError("fund_code is required")
 
         try:
-            # 初始化数据源
-            data_source = DataSourceProxy()
+            # 获取数据源
+            data_source = get_data_source_proxy()
 
             # 更新进度
             self.update_progress(20)
@@ -87,5 +87,5 @@ class FundInfoTask(BaseTask):
             return fund_data
 
         except Exception as e:
-            logger.error("更新基金信息失败: %s", str(e), exc_info=True)  # 添加完整的错误堆栈
+            logger.error("更新基金信息失败: %s", e, exc_info=True)  # 添加完整的错误堆栈
             raise
@@ -1,12 +1,11 @@
 import logging
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Any, Dict
 
-from data_source.proxy import DataSourceProxy
-from kz_dash.models.database import update_record
+from data_source.proxy import get_data_source_proxy
 from kz_dash.scheduler.base_task import BaseTask
+from models.database import update_records_bulk
 from models.fund import ModelFundNav
-from kz_dash.utility.datetime_helper import get_date_str_after_days, get_days_between_dates
 
 from task.task_config import PARAM_FUND_CODE
 
@@ -62,8 +61,8 @@ class FundNavTask(BaseTask):
         end_date = kwargs.get("end_date")
 
         try:
-            # 初始化数据源
-            data_source = DataSourceProxy()
+            # 获取数据源
+            data_source = get_data_source_proxy()
 
             # 获取基金历史净值数据大小
             nav_history_size_response = data_source.get_fund_nav_history_size()
@@ -71,11 +70,12 @@ class FundNavTask(BaseTask):
                 raise ValueError(nav_history_size_response["message"])
             self.update_progress(30)
 
+            start = date.fromisoformat(start_date)
             if not end_date:
                 # 默认结束日期是 开始日期
-                end_date = get_date_str_after_days(start_date, nav_history_size_response["data"])
+                end_date = (start + timedelta(days=nav_history_size_response["data"])).isoformat()
             else:
-                size = get_days_between_dates(start_date, end_date)
+                size = (date.fromisoformat(end_date) - start).days
                 if size < 0:
                     raise ValueError("结束日期不能早于开始日期")
                 if size > nav_history_size_response["data"]:
@@ -95,12 +95,11 @@ class FundNavTask(BaseTask):
             logger.info("正在更新数据库...")
             # 批量保存净值到数据库
             nav_data = nav_history_response["data"]
-            for nav_item in nav_data:
-                update_record(
-                    ModelFundNav,
-                    {"fund_code": fund_code, "nav_date": nav_item["nav_date"]},
-                    nav_item,
-                )
+            update_records_bulk(
+                ModelFundNav,
+                [{"fund_code": fund_code, **nav_item} for nav_item in nav_data],
+                [ModelFundNav.fund, ModelFundNav.nav_date],
+            )
 
             self.update_progress(100)
             logger.info("基金 %s 信息更新完成", fund_code)
@@ -108,5 +107,5 @@ class FundNavTask(BaseTask):
             return nav_history_response["data"]
 
         except Exception as e:
-            logger.error("更新基金信息失败: %s", str(e), exc_info=True)  # 添加完整的错误堆栈
+            logger.error("更新基金信息失败: %s", e, exc_info=True)  # 添加完整的错误堆栈
             raise
@@ -1,5 +1,4 @@
 import logging
-import time
 from datetime import datetime
 from typing import Any, Dict
 
@@ -26,12 +25,11 @@ class PortfolioUpdateTask(BaseTask):
         if not portfolio_id:
             raise ValueError("portfolio_id is required")
 
-        # 模拟更新过程
+        # 更新过程(尚未接入实际更新逻辑，仅上报进度)
         steps = ["获取最新净值", "计算持仓市值", "更新收益率", "生成报表"]
         total_steps = len(steps)
 
         for i, step in enumerate(steps):
-            time.sleep(1)
             progress = (i + 1) * (100 // total_steps)
             self.update_progress(progress)
             logger.info("正在 %s...", step)
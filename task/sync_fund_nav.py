@@ -1,21 +1,22 @@
 import logging
-from datetime import datetime
+from datetime import date, datetime
+from itertools import accumulate
 from random import Random
 from typing import Any, Dict
 
-from data_source.proxy import DataSourceProxy
+from data_source.proxy import get_data_source_proxy
 from kz_dash.models.database import get_record
 from models.fund import ModelFund
 from kz_dash.scheduler.task_factory import TaskFactory
-from kz_dash.utility.datetime_helper import get_date_str_after_days, get_days_between_dates
 
-from task.task_config import PARAM_FUND_CODE, PARAM_SUB_TASK_DELAY
+from task.task_config import PARAM_FUND_CODE, PARAM_SUB_TASK_DELAY, split_date_range
 from kz_dash.scheduler.base_task import BaseTask
+from kz_dash.scheduler.job_manager import JobManager
 
 logger = logging.getLogger(__name__)
 
-# 创建Random实例
-random = Random()
+# 随机数生成方法，用于错开子任务的执行时间
+_randrange = Random().randrange
 
 
 class SyncFundNavTask(BaseTask):
@@ -31,7 +32,17 @@ class SyncFundNavTask(BaseTask):
             "name": "【同步】基金历史净值",
             "description": "同步单个基金历史净值",
             "timeout": 300,
-            "params": [PARAM_FUND_CODE, PARAM_SUB_TASK_DELAY],
+            "params": [
+                PARAM_FUND_CODE,
+                {
+                    "name": "开始日期",
+                    "key": "start_date",
+                    "type": "date",
+                    "required": False,
+                    "description": "开始日期，默认为基金成立日期",
+                },
+                PARAM_SUB_TASK_DELAY,
+            ],
         }
 
     @classmethod
@@ -39,8 +50,6 @@ class SyncFundNavTask(BaseTask):
         return "同步单个基金历史净值"
 
     def execute(self, **kwargs) -> Dict[str, Any]:
-        from scheduler.job_manager import JobManager
-
         logger.info("[%s] 开始同步基金净值 %s", datetime.now(), self.task_id)
 
         # 获取参数
@@ -51,18 +60,21 @@ class SyncFundNavTask(BaseTask):
         sub_task_delay = kwargs.get("sub_task_delay", 2)
 
         try:
-            # 初始化数据源
-            data_source = DataSourceProxy()
-
-            # 1.获取基金信息,确定基金起始日期
-            fund_info = get_record(ModelFund, {"code": fund_code})
-            if fund_info:
-                start_date = fund_info.establishment_date.strftime("%Y-%m-%d")
-            else:
-                result = TaskFactory().execute_task(
-                    "fund_detail", self.task_id, fund_code=fund_code
-                )
-                start_date = result.get("establishment_date")
+            # 获取数据源
+            data_source = get_data_source_proxy()
+            job_manager = JobManager()
+
+            # 1.获取基金信息,确定基金起始日期(调用方已提供时不再查询)
+            start_date = kwargs.get("start_date")
+            if not start_date:
+                fund_info = get_record(ModelFund, {"code": fund_code})
+                if fund_info:
+                    start_date = fund_info.establishment_date.isoformat()
+                else:
+                    result = TaskFactory().execute_task(
+                        "fund_detail", self.task_id, fund_code=fund_code
+                    )
+                    start_date = result.get("establishment_date")
             self.update_progress(5)
             # 获取基金历史净值数据大小
             nav_history_size_response = data_source.get_fund_nav_history_size()
@@ -70,41 +82,38 @@ class SyncFundNavTask(BaseTask):
                 raise ValueError(nav_history_size_response["message"])
 
             # 2.计算日期区间
-            today = datetime.now().strftime("%Y-%m-%d")
+            today = date.today().isoformat()
             days_per_task = nav_history_size_response["data"]
 
-            # 3.批量添加任务
-            current_date = start_date
-            delay = 0
+            # 3.计算所有子任务的日期区间和延迟时间
+            windows = split_date_range(start_date, today, days_per_task)
+            # 每个子任务比上一个随机延后 [0, sub_task_delay] 秒，第一个任务不延迟
+            delays = accumulate(
+                (_randrange(sub_task_delay + 1) for _ in range(len(windows) - 1)), initial=0
+            )
+            pending = [
+                (window_start, window_end, delay)
+                for (window_start, window_end), delay in zip(windows, delays)
+            ]
+
+            # 4.批量添加任务
             tasks = []
-
-            while get_days_between_dates(current_date, today) >= 0:
-                # 计算结束日期
-                end_date = get_date_str_after_days(current_date, days_per_task)
-                if get_days_between_dates(today, end_date) > 0:
-                    end_date = today
-
-                logger.info("添加任务: %s [%s-%s]", fund_code, current_date, end_date)
-
-                # 添加任务
-                sub_task_id = JobManager().add_task(
+            for task_start_date, task_end_date, task_delay in pending:
+                logger.info("添加任务: %s [%s-%s]", fund_code, task_start_date, task_end_date)
+                sub_task_id = job_manager.add_task(
                     "fund_nav",
                     parent_task_id=self.task_id,
                     fund_code=fund_code,
-                    start_date=current_date,
-                    end_date=end_date,
-                    delay=delay,
+                    start_date=task_start_date,
+                    end_date=task_end_date,
+                    delay=task_delay,
                 )
                 tasks.append(sub_task_id)
 
-                # 更新下一个任务的起始日期和延迟时间
-                current_date = get_date_str_after_days(end_date, 1)
-                delay += random.randint(0, sub_task_delay)
-
             self.update_progress(10)
             logger.info("成功添加 %d 个任务", len(tasks))
             return {"tasks": tasks}
 
         except Exception as e:
-            logger.error("同步基金净值失败: %s", str(e), exc_info=True)  # 添加完整的错误堆栈
+            logger.error("同步基金净值失败: %s", e, exc_info=True)  # 添加完整的错误堆栈
             raise
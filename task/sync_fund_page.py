@@ -3,17 +3,28 @@ from datetime import datetime
 from random import Random
 from typing import Any, Dict
 
-from data_source.proxy import DataSourceProxy
-from kz_dash.models.database import get_record, get_record_count, update_record
-from models.fund import ModelFund, ModelFundNav
-
-from task.task_config import PARAM_FUND_TYPE, PARAM_PAGE, PARAM_PAGE_SIZE, PARAM_SUB_TASK_DELAY
+from data_source.proxy import get_data_source_proxy
+from models.database import (
+    get_fund_establishment_dates,
+    get_fund_nav_counts,
+    update_records_bulk,
+)
+from models.fund import ModelFundNav
+
+from task.task_config import (
+    PARAM_FUND_TYPE,
+    PARAM_HISTORY_NAV,
+    PARAM_PAGE,
+    PARAM_PAGE_SIZE,
+    PARAM_SUB_TASK_DELAY,
+)
 from kz_dash.scheduler.base_task import BaseTask
+from kz_dash.scheduler.job_manager import JobManager
 
 logger = logging.getLogger(__name__)
 
-# 创建Random实例
-random = Random()
+# 随机数生成方法，用于错开子任务的执行时间
+_randrange = Random().randrange
 
 
 class SyncFundListPageTask(BaseTask):
@@ -34,14 +45,7 @@ class SyncFundListPageTask(BaseTask):
                 PARAM_PAGE,
                 PARAM_PAGE_SIZE,
                 PARAM_SUB_TASK_DELAY,
-                {
-                    "name": "是否获取历史净值",
-                    "key": "history_nav",
-                    "type": "boolean",
-                    "required": False,
-                    "default": True,
-                    "description": "没有历史净值，是否同步历史净值",
-                },
+                PARAM_HISTORY_NAV,
             ],
         }
 
@@ -50,8 +54,6 @@ class SyncFundListPageTask(BaseTask):
         return "基金最新净值列表页"
 
     def execute(self, **kwargs) -> Dict[str, Any]:
-        from scheduler.job_manager import JobManager
-
         logger.info("[%s] 开始同步基金净值列表页 %s", datetime.now(), self.task_id)
 
         # 获取参数
@@ -67,10 +69,13 @@ class SyncFundListPageTask(BaseTask):
         history_nav = kwargs.get("history_nav")
         sub_task_delay = kwargs.get("sub_task_delay", 2)
         try:
-            # 初始化数据源
-            data_source = DataSourceProxy()
+            # 获取数据源
+            data_source = get_data_source_proxy()
+            job_manager = JobManager()
 
             delay = 0
+            # 每个子任务随机增加 [0, sub_task_delay] 秒的间隔
+            delay_range = sub_task_delay + 1
             index = 0
             # 1. 获取列表页数据
             fund_list_response = data_source.get_fund_nav_list(
@@ -80,44 +85,54 @@ class SyncFundListPageTask(BaseTask):
                 raise ValueError(fund_list_response["message"])
             self.update_progress(10)
 
-            # 2. 遍历基金列表
-            for fund in fund_list_response["data"]["items"]:
-                # 3. 获取基金信息
-                fund_info = get_record(ModelFund, {"code": fund["fund_code"]})
-                if not fund_info:
+            # 2. 批量查询基金信息和历史净值数量
+            items = fund_list_response["data"]["items"]
+            fund_codes = [fund["fund_code"] for fund in items]
+            establishment_dates = get_fund_establishment_dates(fund_codes)
+            nav_counts = get_fund_nav_counts(fund_codes)
+
+            # 遍历基金列表
+            nav_rows = []
+            for fund in items:
+                # 3. 检查基金信息
+                if fund["fund_code"] not in establishment_dates:
                     # 3.1 同步基金信息
-                    JobManager().add_task(
+                    job_manager.add_task(
                         "fund_detail",
                         parent_task_id=self.task_id,
                         fund_code=fund["fund_code"],
                         delay=delay,
                     )
-                    delay += random.randint(0, sub_task_delay)
+                    delay += _randrange(delay_range)
 
                 # 3.2 如果没有历史数据，则同步历史数据
-                history_count = get_record_count(ModelFundNav, {"fund_code": fund["fund_code"]})
+                history_count = nav_counts.get(fund["fund_code"], 0)
                 if history_nav and history_count == 0:
-                    # 3.3 添加同步历史数据任务
-                    JobManager().add_task(
+                    # 3.3 添加同步历史数据任务，已知成立日期时直接传入，子任务不再查询
+                    task_params = {}
+                    establishment_date = establishment_dates.get(fund["fund_code"])
+                    if establishment_date:
+                        task_params["start_date"] = establishment_date.isoformat()
+                    job_manager.add_task(
                         "sync_fund_nav",
                         parent_task_id=self.task_id,
                         fund_code=fund["fund_code"],
                         delay=delay,
+                        **task_params,
                     )
-                    delay += random.randint(0, sub_task_delay)
+                    delay += _randrange(delay_range)
                 else:
-                    # 3.4 更新基金净值
-                    update_record(
-                        ModelFundNav,
-                        {"fund_code": fund["fund_code"], "nav_date": fund["nav_date"]},
-                        fund,
-                    )
-                self.update_progress(10 + 90 * (index / len(fund_list_response["data"]["items"])))
+                    # 3.4 收集需要更新的基金净值
+                    nav_rows.append(fund)
+                self.update_progress(10 + 90 * (index / len(items)))
                 index += 1
 
+            # 4. 批量更新基金净值
+            update_records_bulk(ModelFundNav, nav_rows, [ModelFundNav.fund, ModelFundNav.nav_date])
+
             self.update_progress(100)
             return fund_list_response
 
         except Exception as e:
-            logger.error("同步基金净值失败: %s", str(e), exc_info=True)
+            logger.error("同步基金净值失败: %s", e, exc_info=True)
             raise
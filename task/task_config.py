@@ -1,6 +1,8 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Protocol, Tuple
+from datetime import date
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -40,13 +42,22 @@ PARAM_PAGE_SIZE = {
     "default": 100,
     "description": "每页数据量",
 }
+# 是否同步历史净值参数
+PARAM_HISTORY_NAV = {
+    "name": "是否获取历史净值",
+    "key": "history_nav",
+    "type": "boolean",
+    "required": False,
+    "default": True,
+    "description": "没有历史净值，是否同步历史净值",
+}
 
 
 # 基金类型选择参数
 
 
 # 基金类型枚举
-class FundType:
+class FundType(IntEnum):
     """基金类型枚举"""
 
     STOCK = 1  # 股票型
@@ -80,6 +91,31 @@ PARAM_FUND_TYPE = {
 }
 
 
+def split_date_range(start_date: str, end_date: str, days: int) -> List[Tuple[str, str]]:
+    """将日期区间切分为多个子区间
+
+    每个子区间的结束日期为起始日期之后 days 天(不超过 end_date)，
+    下一个子区间从上一个结束日期的后一天开始
+
+    Args:
+        start_date: 开始日期(YYYY-MM-DD)
+        end_date: 结束日期(YYYY-MM-DD)
+        days: 每个子区间跨越的天数
+
+    Returns:
+        子区间的 (开始日期, 结束日期) 列表，开始日期晚于结束日期时为空
+    """
+    start = date.fromisoformat(start_date).toordinal()
+    end = date.fromisoformat(end_date).toordinal()
+    return [
+        (
+            date.fromordinal(current).isoformat(),
+            date.fromordinal(min(current + days, end)).isoformat(),
+        )
+        for current in range(start, end + 1, days + 1)
+    ]
+
+
 class TaskProgressUpdater(Protocol):
     """任务进度更新器协议"""
 
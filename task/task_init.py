@@ -1,14 +1,17 @@
-from kz_dash.scheduler.task_factory import TaskFactory
-from task.fund_nav import FundNavTask
-from task.sync_fund_nav import SyncFundNavTask
-from task.sync_fund_page import SyncFundListPageTask
-from task.data_sync import DataSyncTask
-from task.fund_detail import FundDetailTask
-from task.fund_info import FundInfoTask
+def init_tasks():
+    """初始化任务类型
 
+    任务模块在这里导入，只有真正初始化任务时才加载数据源和模型等依赖
+    """
+    from kz_dash.scheduler.task_factory import TaskFactory
+    from task.data_sync import DataSyncTask
+    from task.fund_detail import FundDetailTask
+    from task.fund_info import FundInfoTask
+    from task.fund_nav import FundNavTask
+    from task.sync_fund_list import SyncFundListTask
+    from task.sync_fund_nav import SyncFundNavTask
+    from task.sync_fund_page import SyncFundListPageTask
 
-def init_tasks():
-    """初始化任务类型"""
     factory = TaskFactory()  # 获取单例实例
 
     factory.register(DataSyncTask)
@@ -18,3 +21,4 @@ def init_tasks():
     factory.register(FundNavTask)
     factory.register(SyncFundNavTask)  # 同步基金净值
     factory.register(SyncFundListPageTask)  # 同步基金净值列表页面
+    factory.register(SyncFundListTask)  # 同步基金净值列表
@@ -23,6 +23,7 @@ import time
 import traceback
 import unittest
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List
 
 import colorama
@@ -45,6 +46,14 @@ class CustomTestResult(unittest.TestResult):
     - 分类存储测试结果
     """
 
+    # 带颜色的测试状态标签
+    _STATUS_TAGS = {
+        "PASS": f"{Fore.GREEN}[PASS]{Style.RESET_ALL}",
+        "FAIL": f"{Fore.RED}[FAIL]{Style.RESET_ALL}",
+        "ERROR": f"{Fore.RED}[ERROR]{Style.RESET_ALL}",
+        "SKIP": f"{Fore.YELLOW}[SKIP]{Style.RESET_ALL}",
+    }
+
     def __init__(self):
         super().__init__()
         self.start_time = None
@@ -55,61 +64,83 @@ class CustomTestResult(unittest.TestResult):
             "error": [],  # 发生错误的测试
             "skipped": [],  # 跳过的测试
         }
-        # 存储错误和失败的详细信息
-        self.error_details: Dict[str, tuple] = {}
-        self.failure_details: Dict[str, tuple] = {}
+        # 存储错误和失败的详细信息(已格式化的追溯信息，不保留追溯对象)
+        self.error_details: Dict[str, str] = {}
+        self.failure_details: Dict[str, str] = {}
 
-    def _format_test_result(self, test, status: str, color: str) -> str:
+    def _format_test_result(self, test, status: str) -> str:
         """
         格式化单个测试结果
 
         Args:
             test: 测试用例对象
             status: 测试状态标识
-            color: 输出颜色代码
 
         Returns:
             格式化后的测试结果字符串
         """
-        elapsed = time.time() - self.start_time
-        return f"{test.id():<60} {color}[{status}]{Style.RESET_ALL} ({elapsed:.3f}s)"
+        elapsed_ns = time.perf_counter_ns() - self.start_time
+        return f"{test.id():<60} {self._STATUS_TAGS[status]} ({elapsed_ns / 1e9:.3f}s)"
 
     def startTest(self, test):
         """记录测试开始时间"""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         super().startTest(test)
 
     def addSuccess(self, test):
         """记录成功的测试"""
-        self.test_results["success"].append(self._format_test_result(test, "PASS", Fore.GREEN))
+        self.test_results["success"].append(self._format_test_result(test, "PASS"))
         super().addSuccess(test)
 
     def addError(self, test, err):
         """记录发生错误的测试"""
-        self.test_results["error"].append(self._format_test_result(test, "ERROR", Fore.RED))
-        self.error_details[test.id()] = err
+        self.test_results["error"].append(self._format_test_result(test, "ERROR"))
+        self.error_details[test.id()] = "".join(traceback.format_exception(*err))
         super().addError(test, err)
 
     def addFailure(self, test, err):
         """记录失败的测试"""
-        self.test_results["failure"].append(self._format_test_result(test, "FAIL", Fore.RED))
-        self.failure_details[test.id()] = err
+        self.test_results["failure"].append(self._format_test_result(test, "FAIL"))
+        self.failure_details[test.id()] = "".join(traceback.format_exception(*err))
         super().addFailure(test, err)
 
     def addSkip(self, test, reason):
         """记录跳过的测试"""
-        self.test_results["skipped"].append(self._format_test_result(test, "SKIP", Fore.YELLOW))
+        self.test_results["skipped"].append(self._format_test_result(test, "SKIP"))
         super().addSkip(test, reason)
 
 
 class CustomTestRunner:
     """自定义测试运行器"""
 
+    # 结果区块的图标
+    _SECTION_ICONS = {
+        "Successes": "✅",
+        "Failures": "❌",
+        "Errors": "⚠️",
+        "Skipped": "⏭️",
+    }
+
     def __init__(self):
         self.start_time = None
-        self.terminal_width = os.get_terminal_size().columns
-        self.divider = "=" * self.terminal_width
-        self.short_divider = "-" * self.terminal_width
+
+    @cached_property
+    def terminal_width(self) -> int:
+        """终端宽度，首次使用时获取，非终端环境下默认为 80"""
+        try:
+            return os.get_terminal_size().columns
+        except OSError:
+            return 80
+
+    @cached_property
+    def divider(self) -> str:
+        """分隔线"""
+        return "=" * self.terminal_width
+
+    @cached_property
+    def short_divider(self) -> str:
+        """短分隔线"""
+        return "-" * self.terminal_width
 
     def _center_text(self, text: str) -> str:
         """居中显示文本"""
@@ -127,12 +158,7 @@ class CustomTestRunner:
     def _print_result_section(self, title: str, results: List[str], color: str = ""):
         """打印结果区块"""
         if results:
-            icon = {
-                "Successes": "✅",
-                "Failures": "❌",
-                "Errors": "⚠️",
-                "Skipped": "⏭️",
-            }.get(title, "")
+            icon = self._SECTION_ICONS.get(title, "")
 
             print(f"\n{self.short_divider}")
             if color:
@@ -141,17 +167,7 @@ class CustomTestRunner:
                 print(f"{icon} {title} ({len(results)})")
             print(f"{self.short_divider}")
 
-            for result in results:
-                print(result)
-
-    def _format_error_detail(self, err_tuple) -> str:
-        """格式化错误详情"""
-        err_type, err_value, err_traceback = err_tuple
-        # 获取格式化的追溯信息
-        formatted_traceback = "".join(
-            traceback.format_exception(err_type, err_value, err_traceback)
-        )
-        return formatted_traceback
+            sys.stdout.write("\n".join(results) + "\n")
 
     def _print_error_details(self, test_outcome: CustomTestResult):
         """打印错误和失败的详细信息"""
@@ -160,15 +176,18 @@ class CustomTestRunner:
             print(self._center_text(f"{Fore.RED}Detailed Error Information{Style.RESET_ALL}"))
             print(self.divider)
 
+            # 拼接后一次性写出，减少输出调用次数
+            lines = []
             for test_id, failure_info in test_outcome.failure_details.items():
-                print(f"\n{Fore.RED}❌ FAILURE in {test_id}{Style.RESET_ALL}")
-                print(self.short_divider)
-                print(self._format_error_detail(failure_info))
+                lines.append(f"\n{Fore.RED}❌ FAILURE in {test_id}{Style.RESET_ALL}")
+                lines.append(self.short_divider)
+                lines.append(failure_info)
 
             for test_id, error_info in test_outcome.error_details.items():
-                print(f"\n{Fore.RED}⚠️ ERROR in {test_id}{Style.RESET_ALL}")
-                print(self.short_divider)
-                print(self._format_error_detail(error_info))
+                lines.append(f"\n{Fore.RED}⚠️ ERROR in {test_id}{Style.RESET_ALL}")
+                lines.append(self.short_divider)
+                lines.append(error_info)
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def _print_statistics(self, test_outcome: CustomTestResult, time_taken: float):
         """打印统计信息"""
@@ -212,11 +231,11 @@ class CustomTestRunner:
     def run(self, test) -> CustomTestResult:
         """运行测试套件"""
         test_outcome = CustomTestResult()
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
 
         self._print_session_header()
         test(test_outcome)
-        time_taken = time.time() - self.start_time
+        time_taken = (time.perf_counter_ns() - self.start_time) / 1e9
 
         # 打印测试结果摘要
         print(f"\n{self.divider}")
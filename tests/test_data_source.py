@@ -23,18 +23,22 @@ class TestDataSource(unittest.TestCase):
             actual_value: 字段的实际值（如果已经获取）
         """
         value = actual_value if actual_value is not None else data.get(field)
-
-        # 准备详细的错误信息
-        error_msg = [
-            f"\n字段验证失败: {field}",
-            "期望: 非空值",
-            f"实际: {value!r}",
-            "\n完整数据:",
-            json.dumps(data, indent=2, ensure_ascii=False, default=str),
-        ]
+        if field in data and value is not None:
+            return
+
+        # 只在断言失败时生成详细的错误信息
+        error_msg = "\n".join(
+            [
+                f"\n字段验证失败: {field}",
+                "期望: 非空值",
+                f"实际: {value!r}",
+                "\n完整数据:",
+                json.dumps(data, indent=2, ensure_ascii=False, default=str),
+            ]
+        )
 
         self.assertIn(field, data, f"缺少必需字段: {field}\n{error_msg}")
-        self.assertIsNotNone(value, "\n".join(error_msg))
+        self.assertIsNotNone(value, error_msg)
 
     def assertIsValidDate(self, value, field_name: str):
         """
@@ -0,0 +1,87 @@
+import sqlite3
+import unittest
+from datetime import date, timedelta
+
+from peewee import SqliteDatabase
+
+from models.database import (
+    SQLITE_MAX_VARIABLES,
+    get_fund_establishment_dates,
+    get_fund_nav_counts,
+    update_records_bulk,
+)
+from models.fund import ModelFund, ModelFundNav
+
+
+class _LimitedSqliteDatabase(SqliteDatabase):
+    """绑定参数上限为 SQLITE_MAX_VARIABLES 的 SQLite 数据库"""
+
+    def _connect(self):
+        conn = super()._connect()
+        conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, SQLITE_MAX_VARIABLES)
+        return conn
+
+
+@unittest.skipUnless(hasattr(sqlite3.Connection, "setlimit"), "需要 Python 3.11+ 的 setlimit")
+class TestUpdateRecordsBulk(unittest.TestCase):
+    """测试批量读写"""
+
+    def setUp(self):
+        self.db = _LimitedSqliteDatabase(":memory:")
+        self.bind = self.db.bind_ctx([ModelFund, ModelFundNav])
+        self.bind.__enter__()
+        self.db.create_tables([ModelFund, ModelFundNav])
+
+    def tearDown(self):
+        self.bind.__exit__(None, None, None)
+        self.db.close()
+
+    def _nav_rows(self, count):
+        start = date(2024, 1, 1)
+        return [
+            {
+                "fund_code": "000001",
+                "nav_date": start + timedelta(days=i),
+                "nav": 1.0,
+                "acc_nav": 1.0,
+                "daily_return": 0.0,
+                "subscription_status": "开放申购",
+                "redemption_status": "开放赎回",
+                "data_source": "eastmoney",
+                "data_source_version": "1.0",
+            }
+            for i in range(count)
+        ]
+
+    def test_respects_variable_limit(self):
+        rows = self._nav_rows(250)
+        self.assertEqual(
+            update_records_bulk(ModelFundNav, rows, [ModelFundNav.fund, ModelFundNav.nav_date]),
+            250,
+        )
+        self.assertEqual(ModelFundNav.select().count(), 250)
+
+    def test_partial_row_keeps_stored_values(self):
+        rows = self._nav_rows(1)
+        rows[0]["dividend"] = "每份派现金0.1元"
+        update_records_bulk(ModelFundNav, rows, [ModelFundNav.fund, ModelFundNav.nav_date])
+
+        partial = self._nav_rows(1)[0]
+        partial["nav"] = 2.0
+        update_records_bulk(ModelFundNav, [partial], [ModelFundNav.fund, ModelFundNav.nav_date])
+
+        record = ModelFundNav.get()
+        self.assertEqual(float(record.nav), 2.0)
+        self.assertEqual(record.dividend, "每份派现金0.1元")
+
+    def test_lookups_respect_variable_limit(self):
+        update_records_bulk(
+            ModelFundNav, self._nav_rows(3), [ModelFundNav.fund, ModelFundNav.nav_date]
+        )
+        codes = [f"{i:06d}" for i in range(SQLITE_MAX_VARIABLES + 200)]
+        self.assertEqual(get_fund_nav_counts(codes), {"000001": 3})
+        self.assertEqual(get_fund_establishment_dates(codes), {})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,29 @@
+import unittest
+
+from task.task_config import split_date_range
+
+
+class TestSplitDateRange(unittest.TestCase):
+    """测试日期区间切分"""
+
+    def test_split(self):
+        self.assertEqual(
+            split_date_range("2024-01-01", "2024-01-10", 3),
+            [
+                ("2024-01-01", "2024-01-04"),
+                ("2024-01-05", "2024-01-08"),
+                ("2024-01-09", "2024-01-10"),
+            ],
+        )
+
+    def test_single_day(self):
+        self.assertEqual(
+            split_date_range("2024-01-01", "2024-01-01", 30), [("2024-01-01", "2024-01-01")]
+        )
+
+    def test_start_after_end(self):
+        self.assertEqual(split_date_range("2024-01-05", "2024-01-01", 30), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)